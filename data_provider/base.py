@@ -18,6 +18,7 @@ import logging
 import random
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict
 
@@ -248,6 +249,8 @@ class DataFetcherManager:
             fetchers: 数据源列表（可选，默认按优先级自动创建）
         """
         self._fetchers: List[BaseFetcher] = []
+        # 批量日线数据缓存：(股票代码, 日期, 天数) -> (数据, 数据源名称)
+        self._daily_data_cache: Dict[Tuple[str, str, int], Tuple[pd.DataFrame, str]] = {}
         
         if fetchers:
             # 按优先级排序
@@ -373,6 +376,69 @@ class DataFetcherManager:
         logger.error(error_summary)
         raise DataFetchError(error_summary)
     
+    def get_daily_data_batch(
+        self,
+        stock_codes: List[str],
+        days: int = 30,
+        max_workers: int = 5
+    ) -> Dict[str, Tuple[pd.DataFrame, str]]:
+        """
+        批量获取多只股票的日线数据
+        
+        各数据源均无多股票日线批量接口，这里用线程池并发调用 get_daily_data，
+        并发数由调用方按数据源限流情况控制。结果按 (代码, 当天日期, 天数) 缓存，
+        同一天内重复获取直接返回缓存。
+        
+        Args:
+            stock_codes: 股票代码列表
+            days: 获取天数
+            max_workers: 最大并发数
+            
+        Returns:
+            {股票代码: (数据, 成功的数据源名称)}，获取失败的股票不包含在结果中
+        """
+        trade_date = datetime.now().strftime('%Y-%m-%d')
+        results: Dict[str, Tuple[pd.DataFrame, str]] = {}
+        missing_codes = []
+        
+        # 只保留当天的缓存，避免长时间运行时缓存无限增长
+        if any(key[1] != trade_date for key in self._daily_data_cache):
+            self._daily_data_cache = {
+                key: value for key, value in self._daily_data_cache.items() if key[1] == trade_date
+            }
+        
+        for code in dict.fromkeys(stock_codes):
+            cached = self._daily_data_cache.get((code, trade_date, days))
+            if cached is not None:
+                results[code] = cached
+            else:
+                missing_codes.append(code)
+        
+        if results:
+            logger.info(f"[批量日线] 缓存命中 {len(results)} 只股票")
+        
+        if not missing_codes:
+            return results
+        
+        logger.info(f"[批量日线] 开始获取 {len(missing_codes)} 只股票的日线数据...")
+        
+        def fetch(code: str) -> Optional[Tuple[pd.DataFrame, str]]:
+            try:
+                return self.get_daily_data(code, days=days)
+            except Exception as e:
+                logger.warning(f"[批量日线] {code} 获取失败: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing_codes)))) as executor:
+            for code, result in zip(missing_codes, executor.map(fetch, missing_codes)):
+                if result is None:
+                    continue
+                self._daily_data_cache[(code, trade_date, days)] = result
+                results[code] = result
+        
+        logger.info(f"[批量日线] 获取完成，成功 {len(results)}/{len(set(stock_codes))}")
+        return results
+    
     @property
     def available_fetchers(self) -> List[str]:
         """返回可用数据源名称列表"""
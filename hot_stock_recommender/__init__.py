@@ -8,17 +8,20 @@
 主入口模块，整合热门股票发现、推荐和报告生成功能
 """
 
-import logging
-from typing import List, Optional
+from __future__ import annotations
 
-from data_provider import DataFetcherManager
-from src.stock_analyzer import StockTrendAnalyzer
+import logging
+from typing import TYPE_CHECKING, List, Optional
 
 from .models import Recommendation
 from .finder import HotStockFinder
 from .recommender import StockRecommender
 from .report import RecommendationReport
 
+if TYPE_CHECKING:
+    from data_provider import DataFetcherManager
+    from src.stock_analyzer import StockTrendAnalyzer
+
 logger = logging.getLogger(__name__)
 
 __version__ = "1.0.0"
@@ -48,8 +51,16 @@ class HotStockRecommender:
             data_fetcher: 数据获取管理器（可选，默认创建新实例）
             trend_analyzer: 趋势分析器（可选，默认创建新实例）
         """
-        self.data_fetcher = data_fetcher or DataFetcherManager()
-        self.trend_analyzer = trend_analyzer or StockTrendAnalyzer()
+        # 数据源和分析器依赖较重，仅在需要默认实例时导入，
+        # 使单独使用 models/report 等子模块时不加载它们
+        if data_fetcher is None:
+            from data_provider import DataFetcherManager
+            data_fetcher = DataFetcherManager()
+        if trend_analyzer is None:
+            from src.stock_analyzer import StockTrendAnalyzer
+            trend_analyzer = StockTrendAnalyzer()
+        self.data_fetcher = data_fetcher
+        self.trend_analyzer = trend_analyzer
 
         # 初始化各组件
         self.finder = HotStockFinder()
@@ -17,16 +17,121 @@ Requirements:
 """
 
 import logging
+import threading
 import time
-from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
-from .models import StockInfo
-from src.config import HOT_STOCK_CONFIG
+from .models import FilterCounts, StockInfo
+from src.config import HOT_STOCK_CONFIG, get_config
 
 logger = logging.getLogger(__name__)
 
+# 尝试导入 akshare（榜单数据源）
+try:
+    import akshare as ak
+except ImportError:
+    ak = None
+    logger.warning("akshare 未安装，热门股票榜单不可用，请运行: pip install akshare")
+
+# StockInfo 字段名 -> 各 API 可能返回的列名（按优先级排列）
+_COLUMN_ALIASES = {
+    'code': ['代码', '证券代码', 'code', 'stock_code'],
+    'name': ['股票名称', '名称', '证券名称', 'name', 'stock_name'],
+    'price': ['最新价', 'price', '最新价(元)', 'current_price'],
+    'change_pct': ['涨跌幅', '涨跌幅(%)', 'change_pct', '涨跌幅%'],
+    'volume': ['成交量', 'volume', '成交量(手)', 'vol'],
+    'amount': ['成交额', 'amount', '成交额(万元)', 'turnover'],
+    'turnover_rate': ['换手率', 'turnover_rate', '换手率(%)', 'turnover%'],
+    'market_cap': ['总市值', 'market_cap', '总市值(亿元)', 'market_value'],
+    'pe_ratio': ['市盈率-动态', 'pe_ratio', '市盈率', 'pe'],
+    'list_date': ['上市时间'],
+}
+
+# 榜单类型 -> (排序列, 榜单名称)
+_RANK_COLUMNS = {
+    'gainers': ('涨跌幅', '涨幅榜'),
+    'volume': ('成交额', '成交额榜'),
+    'turnover': ('换手率', '换手率榜'),
+}
+
+# 全市场快照中转换为 float32 存储的行情列
+_SPOT_FLOAT32_COLUMNS = ['最新价', '涨跌幅', '换手率', '成交量', '成交额', '总市值']
+
+# 需要转换为浮点数的字段
+_NUMERIC_FIELDS = ['price', 'change_pct', 'volume', 'amount', 'turnover_rate', 'market_cap', 'pe_ratio']
+
+# StockInfo 要求非负的字段
+_NON_NEGATIVE_FIELDS = ['price', 'volume', 'amount', 'market_cap', 'list_days']
+
+# 磁盘缓存文件前缀（与 _fetch_spot_snapshot / _fetch_hot_up_snapshot 的缓存键对应）
+_DISK_CACHE_PREFIXES = ('spot', 'hot_up')
+
+# 实时行情补全的字段：StockInfo 字段名 -> UnifiedRealtimeQuote 属性名
+_QUOTE_FIELDS = {
+    'price': 'price',
+    'change_pct': 'change_pct',
+    'volume': 'volume',
+    'amount': 'amount',
+    'turnover_rate': 'turnover_rate',
+    'market_cap': 'total_mv',
+}
+
+# 过滤原因编码（0 表示通过，其余按检查顺序排列）
+_REASON_KEEP = 0
+_REASON_ST = 1
+_REASON_PRICE_LOW = 2
+_REASON_PRICE_HIGH = 3
+_REASON_NEW = 4
+
+
+def _filter_reasons(
+    is_st: np.ndarray,
+    price: np.ndarray,
+    list_days: np.ndarray,
+    min_price: float,
+    max_price: float,
+    min_list_days: int
+) -> np.ndarray:
+    """
+    计算每只股票的过滤原因
+
+    np.select 按条件顺序取第一个命中的原因，与逐条检查、遇到不满足即跳过的语义一致。
+
+    Args:
+        is_st: 是否为ST股票
+        price: 最新价
+        list_days: 上市天数（0 表示未知，不参与新股过滤）
+        min_price: 最低价格
+        max_price: 最高价格
+        min_list_days: 最少上市天数
+
+    Returns:
+        int8 数组，_REASON_KEEP 表示通过所有过滤条件
+    """
+    return np.select(
+        [
+            is_st,
+            price < min_price,
+            price > max_price,
+            (list_days > 0) & (list_days < min_list_days),
+        ],
+        [_REASON_ST, _REASON_PRICE_LOW, _REASON_PRICE_HIGH, _REASON_NEW],
+        default=_REASON_KEEP,
+    ).astype(np.int8)
+
+
+def _cast_spot_float32(df: pd.DataFrame) -> None:
+    """将A股实时行情快照的行情数值列原地转换为 float32"""
+    for column in _SPOT_FLOAT32_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(np.float32)
+
 
 class HotStockFinder:
     """
@@ -36,20 +141,27 @@ class HotStockFinder:
 
     Attributes:
         cache_ttl: 缓存有效期（秒），默认30分钟
-        _cache: 缓存字典，存储榜单数据
+        max_cache_entries: 最多缓存的数据份数（LRU 淘汰）
+        cache_dir: 磁盘缓存目录（重启后同一交易日内仍可复用快照）
+        _cache: 缓存字典，存储榜单数据（按最近使用排序）
         _cache_timestamps: 缓存时间戳字典
+        _cache_lock: 缓存读写锁（缓存可能被多个线程同时访问）
     """
 
-    def __init__(self, cache_ttl: int = 1800):
+    def __init__(self, cache_ttl: int = 1800, max_cache_entries: int = 8):
         """
         初始化发现器
 
         Args:
             cache_ttl: 缓存有效期（秒），默认30分钟
+            max_cache_entries: 最多缓存的数据份数，超出时淘汰最久未使用的
         """
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, pd.DataFrame] = {}
+        self.max_cache_entries = max_cache_entries
+        self.cache_dir = Path(HOT_STOCK_CONFIG.get('cache_dir', './data/hot_stock_cache'))
+        self._cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
         self._cache_timestamps: Dict[str, float] = {}
+        self._cache_lock = threading.Lock()
 
         # 从配置加载过滤条件
         filter_config = HOT_STOCK_CONFIG.get('filter', {})
@@ -60,6 +172,9 @@ class HotStockFinder:
         # 从配置加载获取数量
         self.fetch_count = HOT_STOCK_CONFIG.get('fetch_count', 30)
 
+        # 实时行情补全的最大并发数（与主流程共用 max_workers，默认3，低并发防封禁）
+        self.max_concurrent = get_config().max_workers
+
         # 统计信息
         self.stats = {
             'gainers_count': 0,
@@ -96,51 +211,36 @@ class HotStockFinder:
         logger.info("开始发现热门股票...")
         start_time = time.time()
 
+        # 整个流程只取一次当天日期，保证各缓存键和上市天数计算使用同一天
+        today = date.today()
+
         try:
-            # 获取人气榜和飙升榜的数据（使用配置的数量）
-            popularity_df = self._fetch_popularity_ranking(limit=self.fetch_count)
-            surge_df = self._fetch_surge_ranking(limit=self.fetch_count)
+            # 人气榜和飙升榜共用同一份快照，只请求一次 API，再按配置数量截取
+            hot_df = self._fetch_hot_up_snapshot(today)
+            popularity_df = hot_df.head(self.fetch_count) if hot_df is not None else None
+            surge_df = popularity_df
 
             # 更新统计信息
             self.stats['gainers_count'] = len(surge_df) if surge_df is not None and not surge_df.empty else 0
             self.stats['volume_count'] = 0
             self.stats['turnover_count'] = len(popularity_df) if popularity_df is not None and not popularity_df.empty else 0
 
-            # 合并两个榜单
-            all_stocks = []
-            stock_codes_seen = set()
-
-            # 处理飙升榜
-            if surge_df is not None and not surge_df.empty:
-                for _, row in surge_df.iterrows():
-                    code = str(row.get('代码', ''))
-                    if code and code not in stock_codes_seen:
-                        stock_info = self._row_to_stock_info(row)
-                        if stock_info:
-                            all_stocks.append(stock_info)
-                            stock_codes_seen.add(code)
-
-            # 处理人气榜
-            if popularity_df is not None and not popularity_df.empty:
-                for _, row in popularity_df.iterrows():
-                    code = str(row.get('代码', ''))
-                    if code and code not in stock_codes_seen:
-                        stock_info = self._row_to_stock_info(row)
-                        if stock_info:
-                            all_stocks.append(stock_info)
-                            stock_codes_seen.add(code)
+            # 合并两个榜单（飙升榜优先），按代码去重
+            merged_df = self._merge_rankings([surge_df, popularity_df], today)
 
             # 更新总数量统计
-            self.stats['total_before_filter'] = len(all_stocks)
+            self.stats['total_before_filter'] = len(merged_df)
 
-            logger.info(f"合并两个榜单后共获得 {len(all_stocks)} 只不重复的热门股票")
+            logger.info(f"合并两个榜单后共获得 {len(merged_df)} 只不重复的热门股票")
             logger.info(f"各榜单获取数量: 飙升榜={self.stats['gainers_count']}, 人气榜={self.stats['turnover_count']}")
 
             # 使用DataFetcherManager获取详细实时行情数据
-            all_stocks = self._enrich_stock_data(all_stocks)
+            merged_df = self._enrich_stock_data(merged_df)
 
-            # 应用过滤条件
-            filtered_stocks = self._apply_filters(all_stocks)
+            # 应用过滤条件（在 DataFrame 上整列过滤，只为保留下来的股票创建 StockInfo）
+            filtered_df = self._apply_filters(merged_df)
+            to_stock_info = self._build_converter(filtered_df.columns)
+            filtered_stocks = [to_stock_info(row) for row in filtered_df.itertuples(index=False, name=None)]
 
             # 更新过滤后数量统计
             self.stats['total_after_filter'] = len(filtered_stocks)
@@ -155,18 +255,24 @@ class HotStockFinder:
             logger.error(f"发现热门股票失败: {e}", exc_info=True)
             return []
 
-    def _enrich_stock_data(self, stocks: List[StockInfo]) -> List[StockInfo]:
+    def _enrich_stock_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         使用DataFetcherManager丰富股票数据，获取缺失的关键指标
 
+        每只股票的实时行情查询相互独立且以网络等待为主，使用线程池并发获取，
+        获取到的非空指标整列写回 DataFrame。
+
         Args:
-            stocks: 股票列表
+            df: 合并去重后的榜单数据
 
         Returns:
-            丰富数据后的股票列表
+            丰富数据后的 DataFrame（行顺序不变）
         """
         logger.info("[步骤] 丰富股票数据，获取缺失的关键指标...")
 
+        if df.empty:
+            return df
+
         try:
             # 导入DataFetcherManager
             from data_provider import DataFetcherManager
@@ -174,442 +280,394 @@ class HotStockFinder:
             # 创建DataFetcherManager实例
             fetcher_manager = DataFetcherManager()
 
-            # 处理每只股票
-            enriched_stocks = []
-            for stock in stocks:
-                try:
-                    # 清理股票代码，移除前缀
-                    code = stock.code.replace('SH', '').replace('SZ', '')
-
-                    # 获取实时行情数据
-                    logger.debug(f"[获取数据] 处理股票: {code} - {stock.name}")
-                    quote = fetcher_manager.get_realtime_quote(code)
-
-                    if quote:
-                        # 更新股票数据
-                        stock.price = quote.price or stock.price
-                        stock.change_pct = quote.change_pct or stock.change_pct
-                        stock.volume = quote.volume or stock.volume
-                        stock.amount = quote.amount or stock.amount
-                        stock.turnover_rate = quote.turnover_rate or stock.turnover_rate
-                        stock.market_cap = quote.total_mv or stock.market_cap
-
-                        # 打印详细的更新信息，便于调试
-                        # 构建调试信息，根据实际数据情况显示
-                        debug_info = f"[更新数据] {code} {stock.name}: "
-                        debug_info += f"价格={stock.price}, 涨跌={stock.change_pct}%, "
-                        debug_info += f"成交量={stock.volume}, 成交额={stock.amount}, "
-                        debug_info += f"换手率={stock.turnover_rate}%"
-
-                        # 只在市值有有效数据时显示
-                        if stock.market_cap and stock.market_cap > 0:
-                            debug_info += f", 市值={stock.market_cap}"
-
-                        logger.debug(debug_info)
-
-                        # 构建获取成功信息
-                        success_info = f"[获取成功] {code} {stock.name}: 价格={stock.price}, 涨跌={stock.change_pct}%, "
-                        success_info += f"成交量={stock.volume}, 成交额={stock.amount}, "
-                        success_info += f"换手率={stock.turnover_rate}%"
-
-                        # 只在市值有有效数据时显示
-                        if stock.market_cap and stock.market_cap > 0:
-                            success_info += f", 市值={stock.market_cap}"
-
-                        logger.debug(success_info)
-                    else:
-                        logger.warning(f"[获取失败] 未获取到 {code} 的实时行情")
-
-                    enriched_stocks.append(stock)
-
-                except Exception as e:
-                    logger.error(f"[获取错误] 处理 {stock.code} 时出错: {e}")
-                    # 继续处理下一只股票
-                    enriched_stocks.append(stock)
-
-            logger.info(f"[步骤] 成功丰富 {len(enriched_stocks)} 只股票的数据")
-            return enriched_stocks
+            # 清理股票代码，移除前缀
+            codes = [code.replace('SH', '').replace('SZ', '') for code in df['code']]
+
+            # 全量数据源（efinance/东财）先预取一次，避免并发线程同时触发全市场拉取
+            fetcher_manager.prefetch_realtime_quotes(codes)
+
+            max_workers = min(self.max_concurrent, len(codes))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # executor.map 按输入顺序返回结果，与 DataFrame 行一一对应
+                quotes = list(executor.map(
+                    lambda code: self._fetch_quote(fetcher_manager, code),
+                    codes
+                ))
+
+            enriched = df.copy()
+            for column, quote_attr in _QUOTE_FIELDS.items():
+                values = pd.to_numeric(
+                    pd.Series([getattr(quote, quote_attr, None) if quote else None for quote in quotes],
+                              index=df.index, dtype=object),
+                    errors='coerce'
+                )
+                # 与逐只更新时的 `quote.x or stock.x` 一致：行情值为空或为0时保留原值
+                enriched[column] = values.where(values.notna() & (values != 0), enriched[column])
+
+            success_count = sum(1 for quote in quotes if quote)
+            logger.info(f"[步骤] 成功丰富 {success_count}/{len(enriched)} 只股票的数据")
+            return enriched
 
         except Exception as e:
             logger.error(f"[步骤] 丰富股票数据失败: {e}")
-            # 如果失败，返回原始股票列表
-            return stocks
+            # 如果失败，返回原始数据
+            return df
 
-    def _fetch_top_gainers(self, limit: int = 100) -> Optional[pd.DataFrame]:
+    def _fetch_quote(self, fetcher_manager, code: str):
         """
-        获取涨幅榜前N只股票
-
-        使用 akshare 的 stock_zh_a_spot_em() 获取实时行情，按涨跌幅排序。
+        获取单只股票的实时行情
 
         Args:
-            limit: 获取数量，默认100
+            fetcher_manager: 数据获取管理器
+            code: 股票代码（已去除市场前缀）
 
         Returns:
-            DataFrame 包含涨幅榜数据，失败返回 None
-
-        Requirements:
-            - 1.1: 获取涨幅榜前100只股票
-            - 1.4: 错误处理和日志记录
-            - 9.1, 9.2: 缓存机制
+            实时行情对象，获取失败返回 None
         """
-        cache_key = f"gainers_{limit}_{date.today()}"
-
-        # 检查缓存
-        if self._is_cache_valid(cache_key):
-            logger.info(f"[缓存命中] 使用缓存的涨幅榜数据")
-            return self._cache[cache_key]
-
         try:
-            import akshare as ak
-
-            logger.info(f"[API调用] ak.stock_zh_a_spot_em() 获取涨幅榜...")
-
-            # 获取全部A股实时行情
-            df = ak.stock_zh_a_spot_em()
-
-            if df is None or df.empty:
-                logger.warning("[API返回] 涨幅榜数据为空")
-                return None
+            logger.debug(f"[获取数据] 处理股票: {code}")
+            quote = fetcher_manager.get_realtime_quote(code)
 
-            # 按涨跌幅降序排序，取前N只
-            df = df.sort_values(by='涨跌幅', ascending=False).head(limit)
+            if quote:
+                # 构建获取成功信息
+                success_info = f"[获取成功] {code}: 价格={quote.price}, 涨跌={quote.change_pct}%, "
+                success_info += f"成交量={quote.volume}, 成交额={quote.amount}, "
+                success_info += f"换手率={quote.turnover_rate}%"
 
-            logger.info(f"[API返回] 涨幅榜获取成功: 返回 {len(df)} 只股票")
-            logger.debug(f"[API返回] 涨幅榜前5只: {df.head(5)[['代码', '名称', '涨跌幅']].to_dict('records')}")
+                # 只在市值有有效数据时显示
+                if quote.total_mv and quote.total_mv > 0:
+                    success_info += f", 市值={quote.total_mv}"
 
-            # 更新缓存
-            self._update_cache(cache_key, df)
+                logger.debug(success_info)
+            else:
+                logger.warning(f"[获取失败] 未获取到 {code} 的实时行情")
 
-            return df
+            return quote
 
         except Exception as e:
-            logger.error(f"[API错误] 获取涨幅榜失败: {e}", exc_info=True)
+            logger.error(f"[获取错误] 处理 {code} 时出错: {e}")
             return None
 
-    def _fetch_top_volume(self, limit: int = 100) -> Optional[pd.DataFrame]:
+    def _fetch_spot_snapshot(self, today: date) -> Optional[pd.DataFrame]:
         """
-        获取成交额榜前N只股票
+        获取全部A股实时行情快照
 
-        使用 akshare 的 stock_zh_a_spot_em() 获取实时行情，按成交额排序。
+        涨幅榜、成交额榜、换手率榜都基于同一份 stock_zh_a_spot_em() 数据，
+        只请求一次并缓存，各榜单在快照上取前N只。行情数值列以 float32 缓存。
+
+        注意：仅由 _fetch_top 使用，find_hot_stocks 当前流程不会请求该快照。
 
         Args:
-            limit: 获取数量，默认100
+            today: 当天日期（用于缓存键）
 
         Returns:
-            DataFrame 包含成交额榜数据，失败返回 None
+            DataFrame 包含全部A股实时行情，失败返回 None
 
         Requirements:
-            - 1.2: 获取成交额榜前100只股票
             - 1.4: 错误处理和日志记录
             - 9.1, 9.2: 缓存机制
         """
-        cache_key = f"volume_{limit}_{date.today()}"
+        cache_key = f"spot_{today}"
 
         # 检查缓存
-        if self._is_cache_valid(cache_key):
-            logger.info(f"[缓存命中] 使用缓存的成交额榜数据")
-            return self._cache[cache_key]
+        df = self._get_cached(cache_key)
+        if df is not None:
+            logger.info("[缓存命中] 使用缓存的A股实时行情快照")
+            return df
 
-        try:
-            import akshare as ak
+        # 检查磁盘缓存（同一交易日内重启时避免重复请求）
+        df = self._load_disk_cache(cache_key)
+        if df is not None:
+            logger.info("[缓存命中] 使用磁盘缓存的A股实时行情快照")
+            # JSON 读回的数值列为 float64，原地转回 float32（内存缓存中的是同一个对象）
+            _cast_spot_float32(df)
+            return df
 
-            logger.info(f"[API调用] ak.stock_zh_a_spot_em() 获取成交额榜...")
+        if ak is None:
+            logger.error("[API错误] akshare 未安装，无法获取A股实时行情")
+            return None
+
+        try:
+            logger.info("[API调用] ak.stock_zh_a_spot_em() 获取A股实时行情快照...")
 
             # 获取全部A股实时行情
             df = ak.stock_zh_a_spot_em()
 
             if df is None or df.empty:
-                logger.warning("[API返回] 成交额榜数据为空")
+                logger.warning("[API返回] A股实时行情数据为空")
                 return None
 
-            # 按成交额降序排序，取前N只
-            df = df.sort_values(by='成交额', ascending=False).head(limit)
+            logger.info(f"[API返回] A股实时行情获取成功: 共 {len(df)} 只股票")
 
-            logger.info(f"[API返回] 成交额榜获取成功: 返回 {len(df)} 只股票")
-            logger.debug(f"[API返回] 成交额榜前5只: {df.head(5)[['代码', '名称', '成交额']].to_dict('records')}")
+            # 快照只用于排名取前N只，float32 精度足够，缓存的全市场数据内存减半
+            _cast_spot_float32(df)
 
             # 更新缓存
             self._update_cache(cache_key, df)
+            self._save_disk_cache(cache_key, df)
 
             return df
 
         except Exception as e:
-            logger.error(f"[API错误] 获取成交额榜失败: {e}", exc_info=True)
+            logger.error(f"[API错误] 获取A股实时行情失败: {e}", exc_info=True)
             return None
 
-    def _fetch_top_turnover(self, limit: int = 100) -> Optional[pd.DataFrame]:
+    def _fetch_top(self, kind: str, limit: int = 100, today: Optional[date] = None) -> Optional[pd.DataFrame]:
         """
-        获取换手率榜前N只股票
+        获取涨幅榜/成交额榜/换手率榜前N只股票
 
-        使用 akshare 的 stock_zh_a_spot_em() 获取实时行情，按换手率排序。
+        在A股实时行情快照上按榜单对应的列取前N只。
+
+        注意：find_hot_stocks 目前只使用人气/飙升榜（_fetch_hot_up_snapshot），
+        不调用本方法；保留它供需要按涨幅、成交额或换手率选股时使用。
 
         Args:
+            kind: 榜单类型，_RANK_COLUMNS 的键（gainers/volume/turnover）
             limit: 获取数量，默认100
+            today: 当天日期（默认取系统日期）
 
         Returns:
-            DataFrame 包含换手率榜数据，失败返回 None
+            DataFrame 包含榜单数据，失败返回 None
 
         Requirements:
-            - 1.3: 获取换手率榜前100只股票
-            - 1.4: 错误处理和日志记录
-            - 9.1, 9.2: 缓存机制
+            - 1.1, 1.2, 1.3: 获取涨幅榜、成交额榜、换手率榜前100只股票
         """
-        cache_key = f"turnover_{limit}_{date.today()}"
-
-        # 检查缓存
-        if self._is_cache_valid(cache_key):
-            logger.info(f"[缓存命中] 使用缓存的换手率榜数据")
-            return self._cache[cache_key]
-
-        try:
-            import akshare as ak
+        rank_col, label = _RANK_COLUMNS[kind]
 
-            logger.info(f"[API调用] ak.stock_zh_a_spot_em() 获取换手率榜...")
-
-            # 获取全部A股实时行情
-            df = ak.stock_zh_a_spot_em()
-
-            if df is None or df.empty:
-                logger.warning("[API返回] 换手率榜数据为空")
-                return None
+        df = self._fetch_spot_snapshot(today or date.today())
+        if df is None:
+            return None
 
-            # 按换手率降序排序，取前N只
-            df = df.sort_values(by='换手率', ascending=False).head(limit)
+        # nlargest 只做部分排序，比 sort_values().head() 开销更小
+        df = df.nlargest(limit, rank_col)
 
-            logger.info(f"[API返回] 换手率榜获取成功: 返回 {len(df)} 只股票")
-            logger.debug(f"[API返回] 换手率榜前5只: {df.head(5)[['代码', '名称', '换手率']].to_dict('records')}")
+        logger.info(f"[API返回] {label}获取成功: 返回 {len(df)} 只股票")
+        logger.debug(f"[API返回] {label}前5只: {df.head(5)[['代码', '名称', rank_col]].to_dict('records')}")
 
-            # 更新缓存
-            self._update_cache(cache_key, df)
+        return df
 
-            return df
-
-        except Exception as e:
-            logger.error(f"[API错误] 获取换手率榜失败: {e}", exc_info=True)
-            return None
-
-    def _fetch_popularity_ranking(self, limit: int = 100) -> Optional[pd.DataFrame]:
+    def _fetch_hot_up_snapshot(self, today: date) -> Optional[pd.DataFrame]:
         """
-        获取人气榜前N只股票
+        获取人气/飙升榜快照
 
-        使用 akshare 的 stock_hot_up_em() 获取人气榜数据。
+        人气榜和飙升榜都来自 akshare 的 stock_hot_up_em()，返回的是同一份数据，
+        只请求一次并缓存，由调用方截取前N只。
 
         Args:
-            limit: 获取数量，默认100
+            today: 当天日期（用于缓存键）
 
         Returns:
-            DataFrame 包含人气榜数据，失败返回 None
+            DataFrame 包含人气/飙升榜数据，失败返回 None
         """
-        cache_key = f"popularity_{limit}_{date.today()}"
+        cache_key = f"hot_up_{today}"
 
         # 检查缓存
-        if self._is_cache_valid(cache_key):
-            logger.info(f"[缓存命中] 使用缓存的人气榜数据")
-            return self._cache[cache_key]
+        df = self._get_cached(cache_key)
+        if df is not None:
+            logger.info("[缓存命中] 使用缓存的人气/飙升榜数据")
+            return df
 
-        try:
-            import akshare as ak
+        # 检查磁盘缓存（同一交易日内重启时避免重复请求）
+        df = self._load_disk_cache(cache_key)
+        if df is not None:
+            logger.info("[缓存命中] 使用磁盘缓存的人气/飙升榜数据")
+            return df
 
-            logger.info(f"[API调用] ak.stock_hot_up_em() 获取人气榜...")
+        if ak is None:
+            logger.error("[API错误] akshare 未安装，无法获取人气/飙升榜")
+            return None
+
+        try:
+            logger.info("[API调用] ak.stock_hot_up_em() 获取人气/飙升榜...")
 
-            # 获取人气榜数据
             df = ak.stock_hot_up_em()
 
             if df is None or df.empty:
-                logger.warning("[API返回] 人气榜数据为空")
+                logger.warning("[API返回] 人气/飙升榜数据为空")
                 return None
 
             # 打印列名，了解数据结构
-            logger.info(f"[API返回] 人气榜数据列名: {list(df.columns)}")
-            # 打印前5行完整数据，了解数据格式
-            logger.info(f"[API返回] 人气榜前5行数据: {df.head(5).to_dict('records')}")
-
-            # 取前N只
-            df = df.head(limit)
+            logger.info(f"[API返回] 人气/飙升榜数据列名: {list(df.columns)}")
+            logger.debug(f"[API返回] 人气/飙升榜前5行数据: {df.head(5).to_dict('records')}")
 
-            logger.info(f"[API返回] 人气榜获取成功: 返回 {len(df)} 只股票")
+            logger.info(f"[API返回] 人气/飙升榜获取成功: 共 {len(df)} 只股票")
 
             # 更新缓存
             self._update_cache(cache_key, df)
+            self._save_disk_cache(cache_key, df)
 
             return df
 
         except Exception as e:
-            logger.error(f"[API错误] 获取人气榜失败: {e}", exc_info=True)
+            logger.error(f"[API错误] 获取人气/飙升榜失败: {e}", exc_info=True)
             return None
 
-    def _fetch_surge_ranking(self, limit: int = 100) -> Optional[pd.DataFrame]:
+    def _merge_rankings(self, frames: List[Optional[pd.DataFrame]], today: date) -> pd.DataFrame:
         """
-        获取飙升榜前N只股票
+        合并多个榜单并按股票代码去重
 
-        使用 akshare 的 stock_hot_up_em() 获取飙升榜数据。
+        按榜单顺序依次处理（榜单顺序即优先级），每个榜单只保留此前未出现过的代码，
+        最后一次性拼接。缺少代码或名称的记录会被跳过。
 
         Args:
-            limit: 获取数量，默认100
+            frames: 榜单 DataFrame 列表，None 或空表会被跳过
+            today: 当天日期（用于计算上市天数）
 
         Returns:
-            DataFrame 包含飙升榜数据，失败返回 None
+            合并去重后的 DataFrame（列名为 StockInfo 字段名）
+
+        Requirements:
+            - 1.5: 去重逻辑
         """
-        cache_key = f"surge_{limit}_{date.today()}"
+        seen_codes = set()
+        new_frames = []
+        skipped = 0
 
-        # 检查缓存
-        if self._is_cache_valid(cache_key):
-            logger.info(f"[缓存命中] 使用缓存的飙升榜数据")
-            return self._cache[cache_key]
+        for df in frames:
+            if df is None or df.empty:
+                continue
 
-        try:
-            import akshare as ak
+            frame = self._normalize_columns(df, today)
 
-            logger.info(f"[API调用] ak.stock_hot_up_em() 获取飙升榜...")
+            valid = (frame['code'] != '') & (frame['name'] != '')
+            skipped += int((~valid).sum())
 
-            # 获取飙升榜数据
-            # 注意：akshare 的 stock_hot_up_em() 函数可能只返回一个榜单
-            # 这里我们使用相同的接口，实际获取的可能是同一个榜单
-            df = ak.stock_hot_up_em()
+            # 整列 isin 判断是否已出现，避免逐行维护 seen 集合
+            frame = frame[valid & ~frame['code'].isin(seen_codes)].drop_duplicates(subset='code', keep='first')
+            seen_codes.update(frame['code'])
+            new_frames.append(frame)
 
-            if df is None or df.empty:
-                logger.warning("[API返回] 飙升榜数据为空")
-                return None
+        if skipped:
+            logger.warning(f"跳过无代码或无名称的股票 {skipped} 条")
 
-            # 打印列名，了解数据结构
-            logger.debug(f"[API返回] 飙升榜数据列名: {list(df.columns)}")
+        if not new_frames:
+            return self._normalize_columns(pd.DataFrame(), today)
 
-            # 取前N只
-            df = df.head(limit)
+        merged = pd.concat(new_frames, ignore_index=True)
 
-            logger.info(f"[API返回] 飙升榜获取成功: 返回 {len(df)} 只股票")
-            # 安全地打印前5只股票
-            try:
-                # 尝试不同的列名组合
-                if '代码' in df.columns and '名称' in df.columns:
-                    logger.debug(f"[API返回] 飙升榜前5只: {df.head(5)[['代码', '名称']].to_dict('records')}")
-                elif '代码' in df.columns:
-                    logger.debug(f"[API返回] 飙升榜前5只: {df.head(5)[['代码']].to_dict('records')}")
-                else:
-                    logger.debug(f"[API返回] 飙升榜前5只: {df.head(5).to_dict('records')}")
-            except Exception as e:
-                logger.debug(f"[API返回] 打印前5只股票失败: {e}")
+        # 整列完成 StockInfo 的数值校验，后续转换可以跳过逐个实例的校验
+        invalid = (merged[_NON_NEGATIVE_FIELDS] < 0).any(axis=1)
+        if invalid.any():
+            logger.warning(f"跳过数据异常（存在负值）的股票: {merged.loc[invalid, 'code'].tolist()}")
+            merged = merged[~invalid]
 
-            # 更新缓存
-            self._update_cache(cache_key, df)
+        return merged
 
-            return df
+    def _normalize_columns(self, df: pd.DataFrame, today: date) -> pd.DataFrame:
+        """
+        将不同 API 返回的列名统一为 StockInfo 字段名
 
-        except Exception as e:
-            logger.error(f"[API错误] 获取飙升榜失败: {e}", exc_info=True)
-            return None
+        每个字段取别名列表中第一个存在的列；代码、名称和行情指标列总是存在
+        （缺失时分别补空字符串和 0.0），市盈率和上市时间缺失时不补列。
+        数值列整列转换为浮点数，无法解析的值按 0.0 处理。
 
-    def _row_to_stock_info(self, row: pd.Series) -> Optional[StockInfo]:
+        Args:
+            df: 榜单原始数据
+            today: 当天日期（用于计算上市天数）
+
+        Returns:
+            只包含已识别字段的新 DataFrame
         """
-        将 DataFrame 行转换为 StockInfo 对象
+        columns = {}
+        for field_name, aliases in _COLUMN_ALIASES.items():
+            for alias in aliases:
+                if alias in df.columns:
+                    columns[field_name] = df[alias]
+                    break
+
+        normalized = pd.DataFrame(columns, index=df.index)
+        for field_name in ('code', 'name'):
+            if field_name not in normalized.columns:
+                normalized[field_name] = ''
+            normalized[field_name] = normalized[field_name].fillna('').astype(str)
+        for field_name in _NUMERIC_FIELDS:
+            if field_name in normalized.columns:
+                normalized[field_name] = pd.to_numeric(normalized[field_name], errors='coerce').fillna(0.0)
+            elif field_name != 'pe_ratio':
+                normalized[field_name] = 0.0
+
+        # 上市天数在过滤和转换时都要用，这里统一计算
+        if 'list_date' in normalized.columns:
+            normalized['list_days'] = self._calc_list_days(normalized['list_date'], today)
+        else:
+            normalized['list_days'] = 0
+
+        return normalized
+
+    @staticmethod
+    def _calc_list_days(list_dates: pd.Series, today: date) -> pd.Series:
+        """
+        根据上市日期整列计算上市天数
 
         Args:
-            row: DataFrame 的一行数据
+            list_dates: 上市日期列（YYYYMMDD 或 YYYY-MM-DD）
+            today: 当天日期
 
         Returns:
-            StockInfo 对象，转换失败返回 None
+            上市天数列，无法解析的日期记为 0
         """
-        try:
-            # 安全获取字段值
-            def safe_float(val, default=0.0):
-                try:
-                    if pd.isna(val):
-                        return default
-                    return float(val)
-                except:
-                    return default
-
-            def safe_int(val, default=0):
-                try:
-                    if pd.isna(val):
-                        return default
-                    return int(val)
-                except:
-                    return default
-
-            # 计算上市天数（如果有上市日期）
-            list_days = 0
-            if '上市时间' in row and not pd.isna(row['上市时间']):
-                try:
-                    list_date_str = str(row['上市时间'])
-                    # 尝试解析日期格式
-                    if len(list_date_str) == 8:  # YYYYMMDD
-                        list_date = datetime.strptime(list_date_str, '%Y%m%d').date()
-                    elif len(list_date_str) == 10:  # YYYY-MM-DD
-                        list_date = datetime.strptime(list_date_str, '%Y-%m-%d').date()
-                    else:
-                        list_date = None
-
-                    if list_date:
-                        list_days = (date.today() - list_date).days
-                except:
-                    list_days = 0
-
-            # 打印行数据，了解数据结构
-            logger.debug(f"[API返回] 行数据: {row.to_dict()}")
-
-            # 尝试不同的列名组合，确保能够从不同 API 响应中提取数据
-            code = str(row.get('代码', '') or row.get('证券代码', '') or row.get('code', '') or row.get('stock_code', ''))
-            name = str(row.get('股票名称', '') or row.get('名称', '') or row.get('证券名称', '') or row.get('name', '') or row.get('stock_name', ''))
-            price = safe_float(row.get('最新价') or row.get('price', '') or row.get('最新价(元)', '') or row.get('current_price', ''))
-            change_pct = safe_float(row.get('涨跌幅') or row.get('涨跌幅(%)', '') or row.get('change_pct', '') or row.get('涨跌幅%', ''))
-            volume = safe_float(row.get('成交量') or row.get('volume', '') or row.get('成交量(手)', '') or row.get('vol', ''))
-            amount = safe_float(row.get('成交额') or row.get('amount', '') or row.get('成交额(万元)', '') or row.get('turnover', ''))
-            turnover_rate = safe_float(row.get('换手率') or row.get('turnover_rate', '') or row.get('换手率(%)', '') or row.get('turnover%', ''))
-            market_cap = safe_float(row.get('总市值') or row.get('market_cap', '') or row.get('总市值(亿元)', '') or row.get('market_value', ''))
-            pe_ratio = safe_float(row.get('市盈率-动态') or row.get('pe_ratio', '') or row.get('市盈率', '') or row.get('pe', '')) if any(key in row for key in ['市盈率-动态', 'pe_ratio', '市盈率', 'pe']) else None
-
-            # 打印提取的股票信息
-            logger.debug(f"[API返回] 提取的股票信息: code={code}, name={name}, price={price}")
-
-            # 检查股票名称是否为空
-            if not name:
-                logger.warning(f"跳过无名称的股票: 代码={code}")
-                return None
+        text = list_dates.astype(str)
+        lengths = text.str.len()
 
-            # 检查股票代码是否为空
-            if not code:
-                logger.warning(f"跳过无代码的股票: 名称={name}")
-                return None
+        # 两种格式分别整列解析，其余长度的值保持 NaT
+        parsed = pd.to_datetime(text.where(lengths == 8), format='%Y%m%d', errors='coerce')
+        parsed = parsed.fillna(pd.to_datetime(text.where(lengths == 10), format='%Y-%m-%d', errors='coerce'))
 
-            try:
-                stock_info = StockInfo(
-                    code=code,
-                    name=name,
-                    price=price,
-                    change_pct=change_pct,
-                    volume=volume,
-                    amount=amount,
-                    turnover_rate=turnover_rate,
-                    market_cap=market_cap,
-                    list_days=list_days,
-                    pe_ratio=pe_ratio,
-                )
+        return (pd.Timestamp(today) - parsed).dt.days.fillna(0).astype(int)
 
-                return stock_info
-            except Exception as e:
-                logger.warning(f"转换股票信息失败: {e}, 代码={code}, 名称={name}")
-                return None
+    @staticmethod
+    def _build_converter(columns: pd.Index) -> Callable[[tuple], StockInfo]:
+        """
+        根据列结构生成行转换函数（行 -> StockInfo）
 
-        except Exception as e:
-            logger.warning(f"转换股票信息失败: {e}")
-            return None
+        同一次运行中列结构固定，列位置和是否有市盈率列在这里一次确定，
+        生成的函数对每行只按位置取值，不再逐行判断列是否存在。
 
-    def _apply_filters(self, stocks: List[StockInfo]) -> List[StockInfo]:
+        数值列已在 _normalize_columns 中整列转换，代码、名称和非负约束已在
+        _merge_rankings 中整列校验，因此使用 StockInfo._unsafe 跳过逐个实例的校验。
+
+        Args:
+            columns: 已统一列名的 DataFrame 列
+
+        Returns:
+            接收 itertuples(index=False, name=None) 产生的元组、返回 StockInfo 的函数
+        """
+        pos = {column: i for i, column in enumerate(columns)}
+        i_code, i_name, i_price = pos['code'], pos['name'], pos['price']
+        i_change, i_volume, i_amount = pos['change_pct'], pos['volume'], pos['amount']
+        i_turnover, i_cap, i_days = pos['turnover_rate'], pos['market_cap'], pos['list_days']
+        make = StockInfo._unsafe
+
+        if 'pe_ratio' in pos:
+            i_pe = pos['pe_ratio']
+
+            def convert(row: tuple) -> StockInfo:
+                return make(row[i_code], row[i_name], row[i_price], row[i_change], row[i_volume],
+                            row[i_amount], row[i_turnover], row[i_cap], int(row[i_days]), row[i_pe])
+        else:
+            def convert(row: tuple) -> StockInfo:
+                return make(row[i_code], row[i_name], row[i_price], row[i_change], row[i_volume],
+                            row[i_amount], row[i_turnover], row[i_cap], int(row[i_days]), None)
+
+        return convert
+
+    def _apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         应用过滤条件
 
         过滤规则：
         1. 不是ST股票或*ST股票
         2. 价格在3元到300元之间
-        3. 总市值大于等于50亿元
+        3. 总市值大于等于50亿元（已取消）
         4. 上市天数大于等于90天
 
+        各条件在 NumPy 数组上整列计算（见 _filter_reasons），每只股票只计入第一个未通过的条件。
+
         Args:
-            stocks: 股票列表
+            df: 合并去重后的榜单数据
 
         Returns:
-            过滤后的股票列表
+            过滤后的 DataFrame
 
         Requirements:
             - 2.1: 过滤ST股票
@@ -618,124 +676,187 @@ class HotStockFinder:
             - 2.4: 过滤市值小于50亿的股票
             - 2.5: 过滤上市时间少于90天的新股
         """
-        if not stocks:
-            return []
-
-        logger.info(f"开始应用过滤条件，初始股票数: {len(stocks)}")
-
-        filtered = []
-        filter_stats = {
-            'st_stock': 0,
-            'price_too_low': 0,
-            'price_too_high': 0,
-            'market_cap_too_small': 0,
-            'newly_listed': 0,
-        }
-
-        for stock in stocks:
-            # 过滤 ST 股票
-            if self._is_st_stock(stock.name):
-                filter_stats['st_stock'] += 1
-                logger.debug(f"过滤ST股票: {stock.code} {stock.name}")
-                continue
-
-            # 过滤价格范围
-            if stock.price < self.min_price:
-                filter_stats['price_too_low'] += 1
-                logger.debug(f"过滤低价股: {stock.code} {stock.name} 价格={stock.price}元")
-                continue
-
-            if stock.price > self.max_price:
-                filter_stats['price_too_high'] += 1
-                logger.debug(f"过滤高价股: {stock.code} {stock.name} 价格={stock.price}元")
-                continue
-
-            # 取消市值过滤条件
-
-            # 过滤上市时间
-            if stock.list_days > 0 and stock.list_days < self.min_list_days:
-                filter_stats['newly_listed'] += 1
-                logger.debug(f"过滤新股: {stock.code} {stock.name} 上市{stock.list_days}天")
-                continue
+        if df.empty:
+            return df
 
-            # 通过所有过滤条件
-            filtered.append(stock)
+        logger.info(f"开始应用过滤条件，初始股票数: {len(df)}")
+
+        # 名称统一转大写一次，后续名称相关判断都复用这一列（字面量匹配，无需正则）
+        # *ST、S*ST、SST 都包含 "ST"，一次子串匹配即可覆盖
+        upper_names = df['name'].str.upper()
+        st_mask = upper_names.str.contains('ST', regex=False)
+
+        # 各列取出为 NumPy 数组，一次计算出每只股票的过滤原因
+        reasons = _filter_reasons(
+            is_st=st_mask.to_numpy(dtype=bool),
+            price=df['price'].to_numpy(dtype=np.float64),
+            list_days=df['list_days'].to_numpy(dtype=np.int64),
+            min_price=self.min_price,
+            max_price=self.max_price,
+            min_list_days=self.min_list_days,
+        )
+        counts = np.bincount(reasons, minlength=_REASON_NEW + 1)
+
+        # 取消市值过滤条件，market_cap_too_small 保持为 0
+        filter_counts = FilterCounts(
+            st_stock=int(counts[_REASON_ST]),
+            price_too_low=int(counts[_REASON_PRICE_LOW]),
+            price_too_high=int(counts[_REASON_PRICE_HIGH]),
+            newly_listed=int(counts[_REASON_NEW]),
+        )
+
+        for label, reason in (('ST股票', _REASON_ST), ('低价股', _REASON_PRICE_LOW),
+                              ('高价股', _REASON_PRICE_HIGH), ('新股', _REASON_NEW)):
+            if counts[reason]:
+                logger.debug(f"过滤{label}: {df.loc[reasons == reason, 'code'].tolist()}")
+
+        filtered = df[reasons == _REASON_KEEP]
 
         # 记录过滤统计
         logger.info(f"过滤完成: 剩余 {len(filtered)} 只股票")
-        logger.info(f"过滤统计: ST股票={filter_stats['st_stock']}, "
-                   f"低价股={filter_stats['price_too_low']}, "
-                   f"高价股={filter_stats['price_too_high']}, "
-                   f"小市值={filter_stats['market_cap_too_small']}, "
-                   f"新股={filter_stats['newly_listed']}")
+        logger.info(f"过滤统计: ST股票={filter_counts.st_stock}, "
+                   f"低价股={filter_counts.price_too_low}, "
+                   f"高价股={filter_counts.price_too_high}, "
+                   f"小市值={filter_counts.market_cap_too_small}, "
+                   f"新股={filter_counts.newly_listed}")
 
         return filtered
 
-    def _is_st_stock(self, name: str) -> bool:
+    def _get_cached(self, cache_key: str) -> Optional[pd.DataFrame]:
         """
-        判断是否为ST股票
+        读取有效的内存缓存
 
-        ST股票特征：
-        - 名称包含 "ST"
-        - 名称包含 "*ST"
-        - 名称包含 "S*ST"
-        - 名称包含 "SST"
+        检查和读取在同一次加锁内完成，避免检查通过后数据被其他线程淘汰。
 
         Args:
-            name: 股票名称
+            cache_key: 缓存键
 
         Returns:
-            True 表示是ST股票，False 表示不是
+            缓存的 DataFrame，不存在或已过期返回 None
+        """
+        with self._cache_lock:
+            data = self._cache.get(cache_key)
+            if data is None:
+                return None
 
-        Requirements:
-            - 2.1: 过滤ST股票和*ST股票
+            timestamp = self._cache_timestamps.get(cache_key)
+            if timestamp is None or time.time() - timestamp >= self.cache_ttl:
+                return None
+
+            # 命中即视为最近使用
+            self._cache.move_to_end(cache_key)
+            return data
+
+    def _update_cache(self, cache_key: str, data: pd.DataFrame) -> None:
         """
-        if not name:
-            return False
+        更新缓存
+
+        缓存键包含日期，长时间运行会不断产生新键，超过 max_cache_entries 时淘汰最久未使用的数据。
 
-        # 检查是否包含ST标记
-        st_markers = ['ST', '*ST', 'S*ST', 'SST']
-        for marker in st_markers:
-            if marker in name.upper():
-                return True
+        Args:
+            cache_key: 缓存键
+            data: 缓存数据
+        """
+        with self._cache_lock:
+            self._cache[cache_key] = data
+            self._cache.move_to_end(cache_key)
+            self._cache_timestamps[cache_key] = time.time()
+
+            while len(self._cache) > self.max_cache_entries:
+                evicted_key, _ = self._cache.popitem(last=False)
+                self._cache_timestamps.pop(evicted_key, None)
+                logger.debug(f"缓存已淘汰: {evicted_key}")
+        logger.debug(f"缓存已更新: {cache_key}")
 
-        return False
+    @staticmethod
+    def _disk_cache_prefix(cache_key: str) -> str:
+        """缓存键去掉日期后的前缀（如 spot_2026-01-05 -> spot）"""
+        return cache_key.rsplit('_', 1)[0]
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
+    def _disk_cache_path(self, cache_key: str) -> Path:
+        """磁盘缓存文件路径"""
+        return self.cache_dir / f"{cache_key}.json"
+
+    def _load_disk_cache(self, cache_key: str) -> Optional[pd.DataFrame]:
         """
-        检查缓存是否有效
+        读取磁盘缓存
+
+        文件修改时间在 cache_ttl 内才视为有效，过期文件直接删除。读取成功后同时放入内存缓存
+        （时间戳沿用文件修改时间，不延长有效期）。
+        缓存目录可能是共享挂载卷，只使用 JSON 这类不会执行代码的格式。
 
         Args:
             cache_key: 缓存键
 
         Returns:
-            True 表示缓存有效，False 表示缓存过期或不存在
+            缓存的 DataFrame，不存在、已过期或读取失败返回 None
         """
-        if cache_key not in self._cache:
-            return False
+        path = self._disk_cache_path(cache_key)
+        try:
+            if not path.exists():
+                return None
+
+            mtime = path.stat().st_mtime
+            if time.time() - mtime >= self.cache_ttl:
+                self._remove_disk_files([path])
+                return None
 
-        if cache_key not in self._cache_timestamps:
-            return False
+            # dtype=False 保留 JSON 中的原始类型（股票代码保持字符串，不会被转成整数）
+            df = pd.read_json(path, orient='split', dtype=False, convert_dates=False)
+        except Exception as e:
+            logger.warning(f"读取磁盘缓存失败: {path}, {e}")
+            return None
 
-        elapsed = time.time() - self._cache_timestamps[cache_key]
-        return elapsed < self.cache_ttl
+        self._update_cache(cache_key, df)
+        with self._cache_lock:
+            self._cache_timestamps[cache_key] = mtime
+        return df
 
-    def _update_cache(self, cache_key: str, data: pd.DataFrame) -> None:
+    def _save_disk_cache(self, cache_key: str, data: pd.DataFrame) -> None:
         """
-        更新缓存
+        写入磁盘缓存（失败只记录日志，不影响主流程）
+
+        写入当天的文件后，删除同类缓存中其他日期的文件，避免缓存目录无限增长。
 
         Args:
             cache_key: 缓存键
             data: 缓存数据
         """
-        self._cache[cache_key] = data
-        self._cache_timestamps[cache_key] = time.time()
-        logger.debug(f"缓存已更新: {cache_key}")
+        path = self._disk_cache_path(cache_key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_json(path, orient='split', index=False, force_ascii=False, double_precision=15)
+            logger.debug(f"磁盘缓存已写入: {path}")
+        except Exception as e:
+            logger.warning(f"写入磁盘缓存失败: {path}, {e}")
+            return
+
+        prefix = self._disk_cache_prefix(cache_key)
+        self._remove_disk_files(
+            stale for stale in self.cache_dir.glob(f"{prefix}_*.json") if stale != path
+        )
+
+    def _remove_disk_files(self, paths) -> None:
+        """删除磁盘缓存文件（失败只记录日志）"""
+        for path in paths:
+            try:
+                path.unlink()
+                logger.debug(f"磁盘缓存已删除: {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"删除磁盘缓存失败: {path}, {e}")
 
     def clear_cache(self) -> None:
-        """清空所有缓存"""
-        self._cache.clear()
-        self._cache_timestamps.clear()
+        """清空所有缓存（内存和磁盘；磁盘上只删除本发现器写入的缓存文件）"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_timestamps.clear()
+
+        if self.cache_dir.exists():
+            for prefix in _DISK_CACHE_PREFIXES:
+                self._remove_disk_files(self.cache_dir.glob(f"{prefix}_*.json"))
+
         logger.info("缓存已清空")
 
 
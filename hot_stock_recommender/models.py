@@ -5,18 +5,22 @@
 定义系统中使用的核心数据结构：
 1. StockInfo - 股票基本信息
 2. Recommendation - 推荐结果
+3. FilterCounts - 过滤统计
+4. Category / RiskLevel - 股票分类和风险等级
 """
 
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Optional, List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StockInfo:
     """
     股票基本信息
     
     包含股票的基本交易数据和市场指标，用于热门股票发现和过滤。
+    使用 __slots__ 存储字段（无实例 __dict__），创建后不可修改。
     
     Attributes:
         code: 股票代码（如"600519"）
@@ -29,6 +33,7 @@ class StockInfo:
         market_cap: 总市值（元）
         list_days: 上市天数
         pe_ratio: 市盈率（可选）
+        amount_yi: 成交额（亿元，由 amount 派生，创建时计算一次）
     """
     code: str
     name: str
@@ -40,9 +45,11 @@ class StockInfo:
     market_cap: float
     list_days: int
     pe_ratio: Optional[float] = None
+    amount_yi: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """数据验证"""
+        object.__setattr__(self, 'amount_yi', self.amount / 1e8)
         if not self.code:
             raise ValueError("股票代码不能为空")
         if not self.name:
@@ -58,28 +65,132 @@ class StockInfo:
         if self.list_days < 0:
             raise ValueError(f"上市天数不能为负数: {self.list_days}")
 
+    @classmethod
+    def _unsafe(
+        cls,
+        code: str,
+        name: str,
+        price: float,
+        change_pct: float,
+        volume: float,
+        amount: float,
+        turnover_rate: float,
+        market_cap: float,
+        list_days: int,
+        pe_ratio: Optional[float] = None
+    ) -> "StockInfo":
+        """
+        跳过 __post_init__ 校验直接创建实例
+
+        仅供已整列校验过的批量数据使用（如 HotStockFinder 的 DataFrame 转换），
+        其他调用方请使用常规构造函数。
+        """
+        obj = object.__new__(cls)
+        set_field = object.__setattr__
+        set_field(obj, 'code', code)
+        set_field(obj, 'name', name)
+        set_field(obj, 'price', price)
+        set_field(obj, 'change_pct', change_pct)
+        set_field(obj, 'volume', volume)
+        set_field(obj, 'amount', amount)
+        set_field(obj, 'turnover_rate', turnover_rate)
+        set_field(obj, 'market_cap', market_cap)
+        set_field(obj, 'list_days', list_days)
+        set_field(obj, 'pe_ratio', pe_ratio)
+        set_field(obj, 'amount_yi', amount / 1e8)
+        return obj
+
+
+class _LabeledIntEnum(IntEnum):
+    """
+    带中文名称的整数枚举
+
+    每个成员定义为 (整数值, 中文名称)，比较和查表都按整数进行；
+    str()/format() 输出中文名称，报告和日志中的显示与原来的字符串字段保持一致。
+    子类通过类关键字参数 kind 指定枚举含义（用于错误信息）。
+    """
+
+    _kind: str        # 枚举含义（用于错误信息）
+    _label: str       # 成员的中文名称
+
+    def __init_subclass__(cls, kind: str = "", **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._kind = kind
+
+    def __new__(cls, value: int, label: str):
+        obj = int.__new__(cls, value)
+        obj._value_ = value
+        obj._label = label
+        return obj
+
+    @property
+    def label(self) -> str:
+        """中文名称"""
+        return self._label
+
+    @classmethod
+    def from_label(cls, label: str) -> "_LabeledIntEnum":
+        """
+        按中文名称查找枚举值
+
+        Raises:
+            ValueError: 名称无效
+        """
+        for member in cls:
+            if member._label == label:
+                return member
+        labels = [member._label for member in cls]
+        raise ValueError(f"无效的{cls._kind}: {label}，必须是 {labels} 之一")
+
+    def __str__(self) -> str:
+        return self._label
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self._label, format_spec)
 
-@dataclass
+
+class Category(_LabeledIntEnum, kind="股票分类"):
+    """
+    股票分类
+    """
+    STRONG = 0, "强势股"
+    PULLBACK = 1, "回调股"
+    BREAKOUT = 2, "突破股"
+    VALUE = 3, "价值股"
+    POTENTIAL = 4, "潜力股"
+
+
+class RiskLevel(_LabeledIntEnum, kind="风险等级"):
+    """
+    风险等级
+    """
+    LOW = 0, "低"
+    MID = 1, "中"
+    HIGH = 2, "高"
+
+
+@dataclass(slots=True, frozen=True)
 class Recommendation:
     """
     推荐结果
     
     包含股票的完整推荐信息，包括基本信息、趋势分析结果、评分、分类和风险评估。
+    使用 __slots__ 存储字段（无实例 __dict__），创建后不可修改。
     
     Attributes:
         stock_info: 股票基本信息
         trend_result: 趋势分析结果（来自 StockTrendAnalyzer）
         score: 综合评分（0-100）
-        category: 股票分类（强势股、回调股、突破股、价值股、潜力股）
-        risk_level: 风险等级（低、中、高）
+        category: 股票分类（Category，也可传入中文名称）
+        risk_level: 风险等级（RiskLevel，也可传入中文名称）
         reasons: 推荐理由列表
         risk_warnings: 风险提示列表
     """
     stock_info: StockInfo
     trend_result: Any  # TrendAnalysisResult 类型，避免循环导入
     score: int
-    category: str
-    risk_level: str
+    category: Category
+    risk_level: RiskLevel
     reasons: List[str] = field(default_factory=list)
     risk_warnings: List[str] = field(default_factory=list)
     
@@ -88,13 +199,16 @@ class Recommendation:
         if not 0 <= self.score <= 100:
             raise ValueError(f"评分必须在0-100之间: {self.score}")
         
-        valid_categories = ["强势股", "回调股", "突破股", "价值股", "潜力股"]
-        if self.category not in valid_categories:
-            raise ValueError(f"无效的股票分类: {self.category}，必须是 {valid_categories} 之一")
+        # 兼容以中文名称传入的分类和风险等级
+        if isinstance(self.category, str):
+            object.__setattr__(self, 'category', Category.from_label(self.category))
+        elif not isinstance(self.category, Category):
+            raise ValueError(f"无效的股票分类: {self.category!r}")
         
-        valid_risk_levels = ["低", "中", "高"]
-        if self.risk_level not in valid_risk_levels:
-            raise ValueError(f"无效的风险等级: {self.risk_level}，必须是 {valid_risk_levels} 之一")
+        if isinstance(self.risk_level, str):
+            object.__setattr__(self, 'risk_level', RiskLevel.from_label(self.risk_level))
+        elif not isinstance(self.risk_level, RiskLevel):
+            raise ValueError(f"无效的风险等级: {self.risk_level!r}")
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -114,8 +228,8 @@ class Recommendation:
             "market_cap": self.stock_info.market_cap,
             "pe_ratio": self.stock_info.pe_ratio,
             "score": self.score,
-            "category": self.category,
-            "risk_level": self.risk_level,
+            "category": self.category.label,
+            "risk_level": self.risk_level.label,
             "reasons": self.reasons,
             "risk_warnings": self.risk_warnings,
             # 趋势分析结果的关键指标
@@ -125,3 +239,25 @@ class Recommendation:
             "trend_status": getattr(self.trend_result, 'trend_status', None),
             "signal_score": getattr(self.trend_result, 'signal_score', None),
         }
+
+
+@dataclass(slots=True)
+class FilterCounts:
+    """
+    过滤统计
+
+    记录热门股票发现阶段各过滤条件排除的股票数量，每只股票只计入第一个未通过的条件。
+
+    Attributes:
+        st_stock: ST股票数量
+        price_too_low: 低价股数量
+        price_too_high: 高价股数量
+        market_cap_too_small: 小市值股票数量
+        newly_listed: 新股数量
+    """
+    st_stock: int = 0
+    price_too_low: int = 0
+    price_too_high: int = 0
+    market_cap_too_small: int = 0
+    newly_listed: int = 0
+
@@ -19,20 +19,143 @@ Requirements:
 - 10.2-10.4: 错误处理和日志
 """
 
+from __future__ import annotations
+
+import heapq
 import logging
+import math
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Tuple
-import pandas as pd
+from typing import List, Optional, Tuple, TYPE_CHECKING
 import numpy as np
 
-from .models import StockInfo, Recommendation
-from data_provider.base import DataFetcherManager
-from src.stock_analyzer import StockTrendAnalyzer, TrendAnalysisResult
+from .models import StockInfo, Recommendation, Category, RiskLevel
 from src.config import HOT_STOCK_CONFIG
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from data_provider.base import DataFetcherManager
+    from src.stock_analyzer import StockTrendAnalyzer, TrendAnalysisResult
+
 logger = logging.getLogger(__name__)
 
+# 市场热度分段评分表：np.searchsorted(阈值, x, side='right') 即为得分下标。
+# 闭区间上界（如涨幅 3%-8% 含 8%）用 math.nextafter 取下一个浮点数作为阈值。
+# 涨幅：<0 | 0-1 | 1-3 | 3-8 | 8-10 | >10
+_HEAT_CHANGE_THRESHOLDS = np.array([0.0, 1.0, 3.0, math.nextafter(8.0, math.inf), math.nextafter(10.0, math.inf)])
+_HEAT_CHANGE_SCORES = np.array([0, 25, 40, 50, 35, 15])
+# 换手率：<1 | 1-3 | 3-5 | 5-15 | 15-20 | >20
+_HEAT_TURNOVER_THRESHOLDS = np.array([1.0, 3.0, 5.0, math.nextafter(15.0, math.inf), math.nextafter(20.0, math.inf)])
+_HEAT_TURNOVER_SCORES = np.array([5, 12, 20, 25, 18, 8])
+# 成交额（亿元）：<5 | 5-10 | 10-20 | 20-50 | >=50
+_HEAT_AMOUNT_THRESHOLDS = np.array([5.0, 10.0, 20.0, 50.0])
+_HEAT_AMOUNT_SCORES = np.array([5, 10, 15, 20, 25])
+
+
+# 分类、风险和理由生成用到的阈值
+_STRONG_MIN_CHANGE_PCT = 5      # 强势股最低涨幅（%）
+_BREAKOUT_MAX_BIAS = 3          # 突破股最大 MA5 乖离率（%）
+_VALUE_MAX_PE = 30              # 价值股最高市盈率
+_ACTIVE_TURNOVER_LOW = 5        # 筹码活跃换手率下限（%）
+_ACTIVE_TURNOVER_HIGH = 15      # 筹码活跃换手率上限（%），超过视为过高
+_HIGH_AMOUNT_YI = 10            # 高成交额阈值（亿元）
+_HIGH_CHANGE_PCT = 8            # 短期涨幅较大阈值（%）
+_VOLATILITY_WINDOW = 10         # 波动率计算窗口（交易日）
+_VOLATILITY_LIMIT = 0.05        # 10日波动率阈值，超过则风险提升一档
+_RISK_LOW_CHANGE_PCT = 3        # 低风险涨幅上限（%）
+_RISK_MID_TURNOVER = 10         # 换手率超过该值（%）至少为中风险
+
+# 日志分隔线
+_BANNER = "=" * 60
+
+# 历史数据必需字段
+_REQUIRED_FIELDS = frozenset(['date', 'open', 'close', 'high', 'low', 'volume'])
+
+# 视为多头排列的趋势状态（按 TrendStatus 成员名比较，无需导入枚举）
+_BULL_STATUS_NAMES = frozenset({'STRONG_BULL', 'BULL'})
+
+
+def _market_heat_scores(
+    change_pct: np.ndarray,
+    turnover: np.ndarray,
+    amount_yi: np.ndarray
+) -> np.ndarray:
+    """
+    批量计算市场热度评分（0-100）
+
+    评分维度：
+    - 涨幅（50分）：3% <= 涨幅 <= 8% 得分高
+    - 换手率（25分）：5% <= 换手率 <= 15% 得分高
+    - 成交额（25分）：成交额越大得分越高
+
+    Args:
+        change_pct: 涨跌幅（%）
+        turnover: 换手率（%）
+        amount_yi: 成交额（亿元）
+
+    Returns:
+        int 数组，与输入一一对应
+    """
+    return (
+        _HEAT_CHANGE_SCORES[np.searchsorted(_HEAT_CHANGE_THRESHOLDS, change_pct, side='right')] +
+        _HEAT_TURNOVER_SCORES[np.searchsorted(_HEAT_TURNOVER_THRESHOLDS, turnover, side='right')] +
+        _HEAT_AMOUNT_SCORES[np.searchsorted(_HEAT_AMOUNT_THRESHOLDS, amount_yi, side='right')]
+    )
+
+
+def _base_risk_levels(change_pct: np.ndarray, turnover: np.ndarray) -> np.ndarray:
+    """
+    批量计算基础风险等级（未考虑波动率）
+
+    np.select 按条件顺序取第一个命中的等级：
+    - 高风险：换手率 > 15% AND 涨幅 > 8%
+    - 中风险：5% <= 换手率 <= 15% AND 3% <= 涨幅 <= 8%
+    - 低风险：换手率 < 5% AND 涨幅 < 3%
+    - 其他情况：换手率 > 15% 或涨幅 > 8% 为高，换手率 > 10% 或涨幅 > 5% 为中，否则为低
+
+    Args:
+        change_pct: 涨跌幅（%）
+        turnover: 换手率（%）
+
+    Returns:
+        int8 数组，取值为 RiskLevel 的整数值
+    """
+    return np.select(
+        [
+            (turnover > _ACTIVE_TURNOVER_HIGH) & (change_pct > _HIGH_CHANGE_PCT),
+            (turnover >= _ACTIVE_TURNOVER_LOW) & (turnover <= _ACTIVE_TURNOVER_HIGH)
+            & (change_pct >= _RISK_LOW_CHANGE_PCT) & (change_pct <= _HIGH_CHANGE_PCT),
+            (turnover < _ACTIVE_TURNOVER_LOW) & (change_pct < _RISK_LOW_CHANGE_PCT),
+            (turnover > _ACTIVE_TURNOVER_HIGH) | (change_pct > _HIGH_CHANGE_PCT),
+            (turnover > _RISK_MID_TURNOVER) | (change_pct > _STRONG_MIN_CHANGE_PCT),
+        ],
+        [RiskLevel.HIGH, RiskLevel.MID, RiskLevel.LOW, RiskLevel.HIGH, RiskLevel.MID],
+        default=RiskLevel.LOW,
+    ).astype(np.int8)
+
+
+def _recent_volatility(closes: np.ndarray) -> np.ndarray:
+    """
+    批量计算最近收盘价的波动率（样本标准差 / 均值）
+
+    与 Series.std()/mean() 一样跳过缺失值；有效数据不足 2 个时结果为 nan（不触发风险提升），
+    均值为 0 时结果为 0。
+
+    Args:
+        closes: (N, _VOLATILITY_WINDOW) 收盘价矩阵，数据不足的股票整行为 nan
+
+    Returns:
+        float64 数组，与输入行一一对应
+    """
+    valid = ~np.isnan(closes)
+    count = valid.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, closes, 0.0).sum(axis=1) / count
+        deviation = np.where(valid, closes - mean[:, None], 0.0)
+        std = np.sqrt((deviation * deviation).sum(axis=1) / (count - 1))
+        return np.where(mean != 0, std / mean, 0.0)
+
 
 class StockRecommender:
     """
@@ -43,7 +166,8 @@ class StockRecommender:
     Attributes:
         data_manager: 数据管理器（用于获取历史数据）
         trend_analyzer: 趋势分析器（用于趋势分析）
-        max_concurrent: 最大并发数
+        max_concurrent: 最大并发数（分析线程）
+        fetch_concurrency: 批量获取历史数据的并发请求数
         history_days: 历史数据天数
         min_history_days: 最少历史数据天数
         min_score: 最低评分阈值
@@ -69,7 +193,14 @@ class StockRecommender:
         self.trend_analyzer = trend_analyzer
         self.max_concurrent = max_concurrent
         
+        # 分析线程池，首次使用时创建并在多次 recommend 调用间复用
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        
         # 从配置加载参数
+        # 历史数据获取是纯网络 I/O，并发度可单独调高；默认与分析线程数相同，
+        # 避免数据源限流（akshare 的请求间隔控制并非线程安全）
+        self.fetch_concurrency = HOT_STOCK_CONFIG.get('fetch_concurrency') or max_concurrent
         self.history_days = HOT_STOCK_CONFIG.get('history_days', 60)
         self.min_history_days = HOT_STOCK_CONFIG.get('min_history_days', 30)
         self.min_score = HOT_STOCK_CONFIG.get('min_score', 60)
@@ -79,11 +210,42 @@ class StockRecommender:
         self.trend_weight = score_weights.get('trend', 0.6)
         self.market_heat_weight = score_weights.get('market_heat', 0.4)
         
-        logger.info(f"StockRecommender 初始化完成: "
-                   f"历史数据={self.history_days}天, "
-                   f"最低评分={self.min_score}, "
-                   f"最大并发={self.max_concurrent}, "
-                   f"评分权重=[趋势:{self.trend_weight}, 市场热度:{self.market_heat_weight}]")
+        logger.info("StockRecommender 初始化完成: "
+                    "历史数据=%s天, 最低评分=%s, 最大并发=%s, 数据获取并发=%s, "
+                    "评分权重=[趋势:%s, 市场热度:%s]",
+                    self.history_days, self.min_score, self.max_concurrent,
+                    self.fetch_concurrency, self.trend_weight, self.market_heat_weight)
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        获取共享的分析线程池（首次调用时创建）
+        
+        ThreadPoolExecutor 按提交的任务数逐个启动线程，候选股票少于 max_concurrent 时
+        不会创建多余线程；线程在多次 recommend 调用之间复用。
+        
+        Returns:
+            分析线程池
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent,
+                    thread_name_prefix='recommender'
+                )
+            return self._pool
+    
+    def close(self) -> None:
+        """关闭分析线程池（之后再次调用 recommend 会重新创建）"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    def __enter__(self) -> "StockRecommender":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     def recommend(
         self,
@@ -94,10 +256,10 @@ class StockRecommender:
         生成推荐列表
         
         流程：
-        1. 并发分析所有热门股票
-        2. 过滤评分低于阈值的股票
-        3. 按评分降序排序
-        4. 选择前N只股票
+        1. 批量获取所有热门股票的历史数据
+        2. 并发分析所有热门股票（只做计算，不再发起网络请求；评分低于阈值的直接丢弃）
+        3. 分析结果随完成随时放入容量为 top_n 的最小堆
+        4. 按评分降序输出前N只股票
         
         Args:
             hot_stocks: 热门股票列表
@@ -115,69 +277,111 @@ class StockRecommender:
             logger.warning("热门股票列表为空，无法生成推荐")
             return []
         
-        logger.info("=" * 60)
-        logger.info(f"开始分析 {len(hot_stocks)} 只热门股票...")
+        logger.info(_BANNER)
+        logger.info("开始分析 %d 只热门股票...", len(hot_stocks))
         start_time = time.time()
         
-        # 并发分析所有股票
-        recommendations = []
+        # 一次性批量获取历史数据，分析线程只负责计算
+        daily_data = self.data_manager.get_daily_data_batch(
+            [stock.code for stock in hot_stocks],
+            days=self.history_days,
+            max_workers=self.fetch_concurrency
+        )
         
-        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-            # 提交所有分析任务
-            future_to_stock = {
-                executor.submit(self._analyze_stock, stock): stock
-                for stock in hot_stocks
-            }
+        # 一次性按列计算所有股票的市场热度评分和基础风险等级
+        n = len(hot_stocks)
+        change_pct = np.fromiter((s.change_pct for s in hot_stocks), dtype=np.float64, count=n)
+        turnover = np.fromiter((s.turnover_rate for s in hot_stocks), dtype=np.float64, count=n)
+        amount_yi = np.fromiter((s.amount_yi for s in hot_stocks), dtype=np.float64, count=n)
+        heat_scores = _market_heat_scores(change_pct, turnover, amount_yi).tolist()
+        base_risks = _base_risk_levels(change_pct, turnover).tolist()
+        
+        # 最近 10 日收盘价堆叠为 (N, 10) 矩阵，一次算出所有股票的波动率
+        recent_closes = np.full((n, _VOLATILITY_WINDOW), np.nan)
+        for i, stock in enumerate(hot_stocks):
+            df = daily_data.get(stock.code, (None, None))[0]
+            if df is None or len(df) < _VOLATILITY_WINDOW or 'close' not in df.columns:
+                continue
+            try:
+                recent_closes[i] = df['close'].iloc[-_VOLATILITY_WINDOW:].to_numpy(dtype=np.float64)
+            except (TypeError, ValueError):
+                # 收盘价无法转换为数值，留给 _analyze_stock 处理
+                pass
+        volatilities = _recent_volatility(recent_closes).tolist()
+        
+        # 并发分析所有股票，结果直接放入容量为 top_n 的最小堆
+        # 堆元素为 (评分, -完成序号, 推荐)：堆顶是当前最低分，同分时先淘汰后完成的
+        top_heap: List[Tuple[int, int, Recommendation]] = []
+        accepted = 0
+        
+        executor = self._get_pool()
+        
+        # 提交所有分析任务
+        future_to_stock = {
+            executor.submit(
+                self._analyze_stock,
+                stock,
+                *daily_data.get(stock.code, (None, None)),
+                heat_scores[i],
+                base_risks[i],
+                volatilities[i]
+            ): stock
+            for i, stock in enumerate(hot_stocks)
+        }
+        
+        # 收集结果
+        total = len(hot_stocks)
+        completed = 0
+        for future in as_completed(future_to_stock):
+            stock = future_to_stock[future]
+            completed += 1
             
-            # 收集结果
-            completed = 0
-            for future in as_completed(future_to_stock):
-                stock = future_to_stock[future]
-                completed += 1
-                
-                try:
-                    recommendation = future.result()
-                    if recommendation:
-                        recommendations.append(recommendation)
-                        logger.info(f"[{completed}/{len(hot_stocks)}] {stock.code} {stock.name} "
-                                  f"分析完成: 评分={recommendation.score}, "
-                                  f"分类={recommendation.category}, "
-                                  f"风险={recommendation.risk_level}")
+            try:
+                recommendation = future.result()
+                if recommendation:
+                    accepted += 1
+                    entry = (recommendation.score, -accepted, recommendation)
+                    if len(top_heap) < top_n:
+                        heapq.heappush(top_heap, entry)
                     else:
-                        logger.warning(f"[{completed}/{len(hot_stocks)}] {stock.code} {stock.name} "
-                                     f"分析失败或评分不足")
-                except Exception as e:
-                    logger.error(f"[{completed}/{len(hot_stocks)}] {stock.code} {stock.name} "
-                               f"分析异常: {e}", exc_info=True)
-        
-        # 过滤评分低于阈值的股票
-        filtered_recommendations = [
-            rec for rec in recommendations
-            if rec.score >= self.min_score
-        ]
-        
-        logger.info(f"分析完成: 共 {len(recommendations)} 只股票通过分析, "
-                   f"{len(filtered_recommendations)} 只评分 >= {self.min_score}")
-        
-        # 按评分降序排序
-        filtered_recommendations.sort(key=lambda x: x.score, reverse=True)
-        
-        # 选择前N只
-        top_recommendations = filtered_recommendations[:top_n]
+                        heapq.heappushpop(top_heap, entry)
+                    logger.info("[%d/%d] %s %s 分析完成: 评分=%s, 分类=%s, 风险=%s",
+                                completed, total, stock.code, stock.name,
+                                recommendation.score, recommendation.category, recommendation.risk_level)
+                else:
+                    logger.warning("[%d/%d] %s %s 分析失败或评分不足",
+                                   completed, total, stock.code, stock.name)
+            except Exception as e:
+                # _analyze_stock 自身会捕获异常，走到这里说明是意料之外的错误，保留完整堆栈
+                logger.error("[%d/%d] %s %s 分析异常: %s",
+                             completed, total, stock.code, stock.name, e, exc_info=True)
+        
+        # _analyze_stock 已过滤评分低于阈值的股票，这里只需按评分降序取出堆中结果
+        logger.info("分析完成: 共 %d 只股票评分 >= %s", accepted, self.min_score)
+        
+        top_recommendations = [entry[2] for entry in sorted(top_heap, reverse=True)]
         
         elapsed = time.time() - start_time
-        logger.info(f"推荐列表生成完成: 推荐 {len(top_recommendations)} 只股票, "
-                   f"耗时 {elapsed:.2f}秒")
-        logger.info("=" * 60)
+        logger.info("推荐列表生成完成: 推荐 %d 只股票, 耗时 %.2f秒",
+                    len(top_recommendations), elapsed)
+        logger.info(_BANNER)
         
         return top_recommendations
     
-    def _analyze_stock(self, stock: StockInfo) -> Optional[Recommendation]:
+    def _analyze_stock(
+        self,
+        stock: StockInfo,
+        df: Optional[pd.DataFrame],
+        source: Optional[str],
+        market_heat_score: int,
+        base_risk: int,
+        volatility: float
+    ) -> Optional[Recommendation]:
         """
         分析单只股票
         
         流程：
-        1. 获取历史数据
+        1. 接收预先批量获取的历史数据
         2. 验证数据有效性
         3. 调用趋势分析器
         4. 计算综合评分
@@ -187,6 +391,11 @@ class StockRecommender:
         
         Args:
             stock: 股票信息
+            df: 历史数据（获取失败时为 None）
+            source: 历史数据的数据源名称
+            market_heat_score: 市场热度评分（recommend 中批量计算）
+            base_risk: 基础风险等级编码（recommend 中批量计算）
+            volatility: 最近10日价格波动率（recommend 中批量计算）
             
         Returns:
             Recommendation 对象，失败返回 None
@@ -198,50 +407,41 @@ class StockRecommender:
             - 6.1-6.4: 风险评估
         """
         try:
-            # Step 1: 获取历史数据
-            logger.debug(f"获取 {stock.code} {stock.name} 历史数据...")
-            
-            df, source = self.data_manager.get_daily_data(
-                stock_code=stock.code,
-                days=self.history_days
-            )
-            
             # Step 2: 验证数据有效性
             if df is None or df.empty:
-                logger.warning(f"{stock.code} {stock.name} 历史数据为空")
+                logger.warning("%s %s 历史数据为空", stock.code, stock.name)
                 return None
             
             if len(df) < self.min_history_days:
-                logger.warning(f"{stock.code} {stock.name} 历史数据不足: "
-                             f"{len(df)}天 < {self.min_history_days}天")
+                logger.warning("%s %s 历史数据不足: %d天 < %d天",
+                               stock.code, stock.name, len(df), self.min_history_days)
                 return None
             
             # 验证必需字段
-            required_fields = ['date', 'open', 'close', 'high', 'low', 'volume']
-            missing_fields = [f for f in required_fields if f not in df.columns]
+            missing_fields = _REQUIRED_FIELDS.difference(df.columns)
             if missing_fields:
-                logger.warning(f"{stock.code} {stock.name} 缺少必需字段: {missing_fields}")
+                logger.warning("%s %s 缺少必需字段: %s", stock.code, stock.name, sorted(missing_fields))
                 return None
             
-            logger.debug(f"{stock.code} {stock.name} 历史数据获取成功: "
-                        f"{len(df)}天, 数据源={source}")
+            logger.debug("%s %s 历史数据获取成功: %d天, 数据源=%s",
+                         stock.code, stock.name, len(df), source)
             
             # Step 3: 调用趋势分析器
             trend_result = self.trend_analyzer.analyze(df, stock.code)
             
             # Step 4: 计算综合评分
-            score = self._calculate_score(trend_result, stock)
+            score = self._calculate_score(trend_result, stock, market_heat_score)
             
             # 过滤评分低于阈值的股票
             if score < self.min_score:
-                logger.debug(f"{stock.code} {stock.name} 评分不足: {score} < {self.min_score}")
+                logger.debug("%s %s 评分不足: %s < %s", stock.code, stock.name, score, self.min_score)
                 return None
             
             # Step 5: 股票分类
             category = self._classify_stock(trend_result, stock)
             
             # Step 6: 风险评估
-            risk_level = self._assess_risk(stock, trend_result, df)
+            risk_level = self._assess_risk(stock, trend_result, volatility, base_risk)
             
             # Step 7: 生成推荐理由和风险提示
             reasons = self._generate_reasons(trend_result, stock, category)
@@ -261,13 +461,16 @@ class StockRecommender:
             return recommendation
             
         except Exception as e:
-            logger.error(f"{stock.code} {stock.name} 分析失败: {e}", exc_info=True)
+            # 单只股票的数据问题很常见，只在 DEBUG 级别输出堆栈
+            logger.error("%s %s 分析失败: %s", stock.code, stock.name, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
     
     def _calculate_score(
         self,
         trend_result: TrendAnalysisResult,
-        stock_info: StockInfo
+        stock_info: StockInfo,
+        market_heat_score: int
     ) -> int:
         """
         计算综合评分（0-100）
@@ -280,6 +483,7 @@ class StockRecommender:
         Args:
             trend_result: 趋势分析结果
             stock_info: 股票信息
+            market_heat_score: 市场热度评分（见 _market_heat_scores）
             
         Returns:
             综合评分（0-100）
@@ -287,106 +491,31 @@ class StockRecommender:
         Requirements:
             - 4.4: 计算综合趋势评分
         """
+        trend_weight = self.trend_weight
+        market_heat_weight = self.market_heat_weight
+        
         # 趋势评分（来自趋势分析器）
         trend_score = trend_result.signal_score
         
-        # 市场热度评分（40分）
-        market_heat_score = self._calculate_market_heat_score(stock_info)
-        
         # 综合评分
         final_score = int(
-            trend_score * self.trend_weight +
-            market_heat_score * self.market_heat_weight
+            trend_score * trend_weight +
+            market_heat_score * market_heat_weight
         )
         
         # 确保在0-100范围内
         final_score = max(0, min(100, final_score))
         
-        logger.debug(f"{stock_info.code} 评分: 趋势={trend_score}, "
-                    f"市场热度={market_heat_score}, 综合={final_score}")
+        logger.debug("%s 评分: 趋势=%s, 市场热度=%s, 综合=%s",
+                     stock_info.code, trend_score, market_heat_score, final_score)
         
         return final_score
     
-    def _calculate_market_heat_score(self, stock_info: StockInfo) -> int:
-        """
-        计算市场热度评分（0-100）
-        
-        评分维度：
-        - 涨幅（50分）：3% < 涨幅 < 8% 得分高
-        - 换手率（25分）：5% < 换手率 < 15% 得分高
-        - 成交额（25分）：成交额越大得分越高
-        
-        Args:
-            stock_info: 股票信息
-            
-        Returns:
-            市场热度评分（0-100）
-        """
-        score = 0
-        
-        # === 涨幅评分（50分）===
-        change_pct = stock_info.change_pct
-        if 3 <= change_pct <= 8:
-            # 理想涨幅区间，满分
-            score += 50
-        elif 1 <= change_pct < 3:
-            # 温和上涨
-            score += 40
-        elif 8 < change_pct <= 10:
-            # 涨幅较大，略有风险
-            score += 35
-        elif 0 <= change_pct < 1:
-            # 微涨
-            score += 25
-        elif change_pct > 10:
-            # 涨幅过大，追高风险
-            score += 15
-        else:
-            # 下跌
-            score += 0
-        
-        # === 换手率评分（25分）===
-        turnover = stock_info.turnover_rate
-        if 5 <= turnover <= 15:
-            # 理想换手率区间
-            score += 25
-        elif 3 <= turnover < 5:
-            # 换手率偏低
-            score += 20
-        elif 15 < turnover <= 20:
-            # 换手率偏高
-            score += 18
-        elif 1 <= turnover < 3:
-            # 换手率很低
-            score += 12
-        elif turnover > 20:
-            # 换手率过高，风险大
-            score += 8
-        else:
-            # 换手率异常低
-            score += 5
-        
-        # === 成交额评分（25分）===
-        # 成交额越大，市场关注度越高
-        amount_billion = stock_info.amount / 1e8  # 转换为亿元
-        if amount_billion >= 50:
-            score += 25
-        elif amount_billion >= 20:
-            score += 20
-        elif amount_billion >= 10:
-            score += 15
-        elif amount_billion >= 5:
-            score += 10
-        else:
-            score += 5
-        
-        return score
-    
     def _classify_stock(
         self,
         trend_result: TrendAnalysisResult,
         stock_info: StockInfo
-    ) -> str:
+    ) -> Category:
         """
         股票分类
         
@@ -402,114 +531,82 @@ class StockRecommender:
             stock_info: 股票信息
             
         Returns:
-            股票分类字符串
+            股票分类
             
         Requirements:
             - 5.1-5.5: 股票分类
         """
-        from src.stock_analyzer import TrendStatus
-        
-        price = trend_result.current_price
         ma5 = trend_result.ma5
         ma10 = trend_result.ma10
-        ma20 = trend_result.ma20
-        change_pct = stock_info.change_pct
         
         # 判断是否多头排列
-        is_bull = trend_result.trend_status in [
-            TrendStatus.STRONG_BULL,
-            TrendStatus.BULL
-        ]
-        
-        # 1. 强势股：多头排列 AND 涨幅 > 5%
-        if is_bull and change_pct > 5:
-            return "强势股"
+        is_bull = trend_result.trend_status.name in _BULL_STATUS_NAMES
         
-        # 2. 回调股：多头排列 AND MA10 < 价格 < MA5
-        if is_bull and ma10 < price < ma5:
-            return "回调股"
+        # 各条件有重叠，必须按原优先级依次判断；非多头时直接跳到突破股判断
+        if is_bull:
+            # 1. 强势股：多头排列 AND 涨幅 > 5%
+            if stock_info.change_pct > _STRONG_MIN_CHANGE_PCT:
+                return Category.STRONG
+            
+            # 2. 回调股：多头排列 AND MA10 < 价格 < MA5
+            if ma10 < trend_result.current_price < ma5:
+                return Category.PULLBACK
         
         # 3. 突破股：MA5刚突破MA10 AND MA10刚突破MA20
         # 简化判断：MA5 > MA10 > MA20 且价格接近MA5（乖离率小于3%）
-        if ma5 > ma10 > ma20 and abs(trend_result.bias_ma5) < 3:
-            return "突破股"
+        if ma5 > ma10 > trend_result.ma20 and abs(trend_result.bias_ma5) < _BREAKOUT_MAX_BIAS:
+            return Category.BREAKOUT
         
         # 4. 价值股：多头排列 AND 市盈率 < 30（简化判断）
-        if is_bull and stock_info.pe_ratio and 0 < stock_info.pe_ratio < 30:
-            return "价值股"
+        pe_ratio = stock_info.pe_ratio
+        if is_bull and pe_ratio and 0 < pe_ratio < _VALUE_MAX_PE:
+            return Category.VALUE
         
         # 5. 潜力股：其他情况
-        return "潜力股"
+        return Category.POTENTIAL
     
     def _assess_risk(
         self,
         stock_info: StockInfo,
         trend_result: TrendAnalysisResult,
-        df: pd.DataFrame
-    ) -> str:
+        volatility: float,
+        base_risk: int
+    ) -> RiskLevel:
         """
         风险评估
         
-        基础风险等级：
-        - 高风险：换手率 > 15% AND 涨幅 > 8%
-        - 中风险：5% < 换手率 < 15% AND 3% < 涨幅 < 8%
-        - 低风险：换手率 < 5% AND 涨幅 < 3%
-        
-        风险调整：
+        基础风险等级和波动率由 recommend 批量计算（_base_risk_levels / _recent_volatility），
+        这里只做波动率调整：
         - 如果价格波动率（最近10日标准差/均值）> 0.05，风险等级提高一档
         
         Args:
             stock_info: 股票信息
             trend_result: 趋势分析结果
-            df: 历史数据
+            volatility: 最近10日价格波动率（数据不足时为 nan）
+            base_risk: 基础风险等级（RiskLevel 的整数值）
             
         Returns:
-            风险等级字符串（"低"、"中"、"高"）
+            风险等级
             
         Requirements:
             - 6.1-6.4: 风险评估
         """
-        turnover = stock_info.turnover_rate
-        change_pct = stock_info.change_pct
+        risk = base_risk
         
-        # 基础风险等级判断
-        if turnover > 15 and change_pct > 8:
-            risk_level = "高"
-        elif 5 <= turnover <= 15 and 3 <= change_pct <= 8:
-            risk_level = "中"
-        elif turnover < 5 and change_pct < 3:
-            risk_level = "低"
-        else:
-            # 其他情况，根据换手率和涨幅综合判断
-            if turnover > 15 or change_pct > 8:
-                risk_level = "高"
-            elif turnover > 10 or change_pct > 5:
-                risk_level = "中"
-            else:
-                risk_level = "低"
-        
-        # 计算价格波动率（最近10日）
-        if len(df) >= 10:
-            recent_prices = df['close'].tail(10)
-            volatility = recent_prices.std() / recent_prices.mean()
+        # 如果波动率 > 0.05，风险等级提高一档（nan 比较结果为 False）
+        if volatility > _VOLATILITY_LIMIT:
+            risk = min(risk + 1, RiskLevel.HIGH)
             
-            # 如果波动率 > 0.05，风险等级提高一档
-            if volatility > 0.05:
-                if risk_level == "低":
-                    risk_level = "中"
-                elif risk_level == "中":
-                    risk_level = "高"
-                
-                logger.debug(f"{stock_info.code} 波动率={volatility:.4f} > 0.05, "
-                           f"风险等级提升")
-        
-        return risk_level
+            logger.debug("%s 波动率=%.4f > %s, 风险等级提升",
+                         stock_info.code, volatility, _VOLATILITY_LIMIT)
+        
+        return RiskLevel(risk)
     
     def _generate_reasons(
         self,
         trend_result: TrendAnalysisResult,
         stock_info: StockInfo,
-        category: str
+        category: Category
     ) -> List[str]:
         """
         生成推荐理由
@@ -529,21 +626,23 @@ class StockRecommender:
             reasons.extend(trend_result.signal_reasons)
         
         # 添加分类相关的理由
-        if category == "强势股":
+        if category is Category.STRONG:
             reasons.append(f"✅ 强势股，涨幅{stock_info.change_pct:.2f}%，市场关注度高")
-        elif category == "回调股":
+        elif category is Category.PULLBACK:
             reasons.append("✅ 回调股，价格回踩MA5-MA10区间，介入时机好")
-        elif category == "突破股":
+        elif category is Category.BREAKOUT:
             reasons.append("✅ 突破股，均线刚形成多头排列，趋势向上")
-        elif category == "价值股":
+        elif category is Category.VALUE:
             reasons.append(f"✅ 价值股，市盈率{stock_info.pe_ratio:.2f}，估值合理")
         
         # 添加市场热度相关的理由
-        if 5 <= stock_info.turnover_rate <= 15:
-            reasons.append(f"✅ 换手率{stock_info.turnover_rate:.2f}%，筹码活跃度适中")
+        turnover = stock_info.turnover_rate
+        if _ACTIVE_TURNOVER_LOW <= turnover <= _ACTIVE_TURNOVER_HIGH:
+            reasons.append(f"✅ 换手率{turnover:.2f}%，筹码活跃度适中")
         
-        if stock_info.amount / 1e8 >= 10:
-            reasons.append(f"✅ 成交额{stock_info.amount/1e8:.2f}亿，市场关注度高")
+        amount_yi = stock_info.amount_yi
+        if amount_yi >= _HIGH_AMOUNT_YI:
+            reasons.append(f"✅ 成交额{amount_yi:.2f}亿，市场关注度高")
         
         return reasons
     
@@ -551,7 +650,7 @@ class StockRecommender:
         self,
         stock_info: StockInfo,
         trend_result: TrendAnalysisResult,
-        risk_level: str
+        risk_level: RiskLevel
     ) -> List[str]:
         """
         生成风险提示
@@ -571,17 +670,19 @@ class StockRecommender:
             warnings.extend(trend_result.risk_factors)
         
         # 添加风险等级相关的提示
-        if risk_level == "高":
+        if risk_level is RiskLevel.HIGH:
             warnings.append("⚠️ 风险等级：高，建议谨慎操作，控制仓位")
-        elif risk_level == "中":
+        elif risk_level is RiskLevel.MID:
             warnings.append("⚠️ 风险等级：中，建议适度参与，注意止损")
         
         # 添加市场热度相关的风险
-        if stock_info.change_pct > 8:
-            warnings.append(f"⚠️ 短期涨幅较大({stock_info.change_pct:.2f}%)，注意回调风险")
+        change_pct = stock_info.change_pct
+        if change_pct > _HIGH_CHANGE_PCT:
+            warnings.append(f"⚠️ 短期涨幅较大({change_pct:.2f}%)，注意回调风险")
         
-        if stock_info.turnover_rate > 15:
-            warnings.append(f"⚠️ 换手率过高({stock_info.turnover_rate:.2f}%)，资金博弈激烈")
+        turnover = stock_info.turnover_rate
+        if turnover > _ACTIVE_TURNOVER_HIGH:
+            warnings.append(f"⚠️ 换手率过高({turnover:.2f}%)，资金博弈激烈")
         
         # 如果没有风险提示，添加一个通用提示
         if not warnings:
@@ -589,53 +690,3 @@ class StockRecommender:
         
         return warnings
 
-
-if __name__ == "__main__":
-    # 测试代码
-    import sys
-    sys.path.insert(0, '..')
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # 创建测试数据
-    from hot_stock_recommender.models import StockInfo
-    
-    test_stocks = [
-        StockInfo(
-            code="600519",
-            name="贵州茅台",
-            price=1650.0,
-            change_pct=3.5,
-            volume=50000,
-            amount=8.25e8,
-            turnover_rate=8.5,
-            market_cap=2.07e12,
-            list_days=5000,
-            pe_ratio=35.0
-        ),
-    ]
-    
-    # 创建推荐器
-    data_manager = DataFetcherManager()
-    trend_analyzer = StockTrendAnalyzer()
-    recommender = StockRecommender(data_manager, trend_analyzer)
-    
-    # 生成推荐
-    recommendations = recommender.recommend(test_stocks, top_n=5)
-    
-    print(f"\n生成 {len(recommendations)} 条推荐:")
-    for i, rec in enumerate(recommendations, 1):
-        print(f"\n{i}. {rec.stock_info.code} {rec.stock_info.name}")
-        print(f"   评分: {rec.score}/100")
-        print(f"   分类: {rec.category}")
-        print(f"   风险: {rec.risk_level}")
-        print(f"   推荐理由:")
-        for reason in rec.reasons:
-            print(f"     {reason}")
-        if rec.risk_warnings:
-            print(f"   风险提示:")
-            for warning in rec.risk_warnings:
-                print(f"     {warning}")
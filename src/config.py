@@ -467,8 +467,10 @@ def get_config() -> Config:
 # === 热门股票推荐配置 ===
 HOT_STOCK_CONFIG = {
     'cache_ttl': 1800,           # 缓存有效期（秒），默认30分钟
+    'cache_dir': os.getenv('HOT_STOCK_CACHE_DIR', './data/hot_stock_cache'),  # 榜单快照磁盘缓存目录
     'top_n': int(os.getenv('HOT_STOCK_TOP_N', '5')),  # 推荐数量，从环境变量获取，默认5只
     'max_concurrent': 10,        # 最大并发数
+    'fetch_concurrency': int(os.getenv('HOT_STOCK_FETCH_CONCURRENCY', '0')),  # 批量获取历史数据的并发请求数，0 表示与分析线程数相同
     'min_score': 60,             # 最低评分阈值
     'history_days': 60,          # 历史数据天数
     'min_history_days': 30,      # 最少历史数据天数